@@ -1,4 +1,4 @@
-import React, { useRef, useEffect, useState } from 'react';
+import React, { useRef, useEffect, useState, useMemo } from 'react';
 import { View, StyleSheet, TouchableOpacity, Text, Modal, Platform, ScrollView } from 'react-native';
 import { LinearGradient } from 'expo-linear-gradient';
 import { WebView } from 'react-native-webview';
@@ -28,7 +28,9 @@ export default function KeplerGLView({
   const [showCO2, setShowCO2] = useState(false);
   const [showTemperature, setShowTemperature] = useState(false);
 
-  const geoJsonData = convertToGeoJSON(
+  // Only rebuild the GeoJSON and page HTML when their inputs change, not on every
+  // parent re-render (e.g. the 1 Hz satellite timer in WeatherGameScreen)
+  const geoJsonData = useMemo(() => convertToGeoJSON(
     existingBuildings, 
     userBuildings, 
     removedBuildings, 
@@ -39,8 +41,19 @@ export default function KeplerGLView({
     removedTrees,
     removedCanals,
     removedStreets
-  );
-  const htmlContent = generateDeckGLHTML(
+  ), [
+    existingBuildings,
+    userBuildings,
+    removedBuildings,
+    location,
+    existingTrees,
+    existingCanals,
+    existingStreets,
+    removedTrees,
+    removedCanals,
+    removedStreets,
+  ]);
+  const htmlContent = useMemo(() => generateDeckGLHTML(
     geoJsonData, 
     location, 
     weatherData, 
@@ -50,7 +63,17 @@ export default function KeplerGLView({
     showHumidity, 
     showCO2, 
     showTemperature
-  );
+  ), [
+    geoJsonData,
+    location,
+    weatherData,
+    mapRegion,
+    showHeat,
+    showWind,
+    showHumidity,
+    showCO2,
+    showTemperature,
+  ]);
 
   const toggleLayer = (layerId, currentValue, setter) => {
     const newValue = !currentValue;
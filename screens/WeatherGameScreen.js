@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect, useRef, useMemo } from 'react';
 import { View, Text, StyleSheet, TouchableOpacity, Platform, ActivityIndicator, Alert, Dimensions, ScrollView, Image, Modal } from 'react-native';
 import { LinearGradient } from 'expo-linear-gradient';
 import MapView, { Marker, Polygon, Circle, Polyline } from 'react-native-maps';
@@ -22,6 +22,9 @@ const WATER_ICON = require('../assets/water.png');
 const EARTH_ICON = require('../assets/earth.png');
 const SATELLITE_ICON = require('../assets/satellite.png');
 
+// Build a Set of item IDs, tolerating missing lists and null entries
+const toIdSet = (items) => new Set(Array.isArray(items) ? items.filter(Boolean).map(item => item.id) : []);
+
 export default function WeatherGameScreen({ onBackToLanding }) {
   const [loading, setLoading] = useState(true);
   const [location, setLocation] = useState(null);
@@ -58,6 +61,12 @@ export default function WeatherGameScreen({ onBackToLanding }) {
     energy: 6,    // Streets built (mockup: 12% of 50 = 6)
   });
 
+  // Removed IDs indexed once per change, so render and remove checks are constant-time lookups
+  const removedBuildingIds = useMemo(() => toIdSet(removedBuildings), [removedBuildings]);
+  const removedTreeIds = useMemo(() => toIdSet(removedTrees), [removedTrees]);
+  const removedCanalIds = useMemo(() => toIdSet(removedCanals), [removedCanals]);
+  const removedStreetIds = useMemo(() => toIdSet(removedStreets), [removedStreets]);
+
   // Rank requirements for calculating percentages
   const kiezGuardianRequirements = {
     life: 60,
@@ -119,9 +128,15 @@ export default function WeatherGameScreen({ onBackToLanding }) {
 
   // Update token charges based on actions
   useEffect(() => {
-    const treesCount = userBuildings.filter(b => b.type === 'tree').length;
-    const buildingsCount = userBuildings.filter(b => b.type === 'building').length;
-    const streetsCount = userBuildings.filter(b => b.type === 'street').length;
+    // Count each item type in a single pass over userBuildings
+    let treesCount = 0;
+    let buildingsCount = 0;
+    let streetsCount = 0;
+    userBuildings.forEach((b) => {
+      if (b.type === 'tree') treesCount++;
+      else if (b.type === 'building') buildingsCount++;
+      else if (b.type === 'street') streetsCount++;
+    });
     
     // Base mockup values (starting from previous iterations)
     const BASE_LIFE = 13;     // 22% of 60
@@ -268,7 +283,7 @@ export default function WeatherGameScreen({ onBackToLanding }) {
       // Add buildings (with null checks)
       if (Array.isArray(existingBuildings) && Array.isArray(removedBuildings)) {
         existingBuildings
-          .filter(b => b && b.id && b.coordinate && !removedBuildings.some(rb => rb && rb.id === b.id))
+          .filter(b => b && b.id && b.coordinate && !removedBuildingIds.has(b.id))
           .forEach(b => {
             if (b && b.coordinate) {
               allItems.push({ ...b, itemType: 'building', isUserAdded: false });
@@ -279,7 +294,7 @@ export default function WeatherGameScreen({ onBackToLanding }) {
       // Add trees (with null checks)
       if (Array.isArray(existingTrees) && Array.isArray(removedTrees)) {
         existingTrees
-          .filter(t => t && t.id && t.coordinate && !removedTrees.some(rt => rt && rt.id === t.id))
+          .filter(t => t && t.id && t.coordinate && !removedTreeIds.has(t.id))
           .forEach(t => {
             if (t && t.coordinate) {
               allItems.push({ ...t, itemType: 'tree', isUserAdded: false });
@@ -300,7 +315,7 @@ export default function WeatherGameScreen({ onBackToLanding }) {
       // Add canals (with null checks)
       if (Array.isArray(existingCanals) && Array.isArray(removedCanals)) {
         existingCanals
-          .filter(c => c && c.id && c.coordinates && !removedCanals.some(rc => rc && rc.id === c.id))
+          .filter(c => c && c.id && c.coordinates && !removedCanalIds.has(c.id))
           .forEach(c => {
             if (c && c.coordinates) {
               allItems.push({ ...c, itemType: 'canal', isUserAdded: false });
@@ -321,7 +336,7 @@ export default function WeatherGameScreen({ onBackToLanding }) {
       // Add streets (with null checks)
       if (Array.isArray(existingStreets) && Array.isArray(removedStreets)) {
         existingStreets
-          .filter(s => s && s.id && s.coordinates && !removedStreets.some(rs => rs && rs.id === s.id))
+          .filter(s => s && s.id && s.coordinates && !removedStreetIds.has(s.id))
           .forEach(s => {
             if (s && s.coordinates) {
               allItems.push({ ...s, itemType: 'street', isUserAdded: false });
@@ -461,18 +476,18 @@ export default function WeatherGameScreen({ onBackToLanding }) {
           const isCanal = Array.isArray(existingCanals) && existingCanals.some(c => c && c.id === item.id);
           const isStreet = Array.isArray(existingStreets) && existingStreets.some(s => s && s.id === item.id);
           
-          if (isTree && item.coordinate && Array.isArray(removedTrees) && !removedTrees.some(rt => rt && rt.id === item.id)) {
+          if (isTree && item.coordinate && Array.isArray(removedTrees) && !removedTreeIds.has(item.id)) {
             setRemovedTrees([...removedTrees, {
               id: item.id,
               coordinate: item.coordinate,
               name: item.name || null,
               type: 'tree',
             }]);
-          } else if (isBuilding && Array.isArray(removedBuildings) && !removedBuildings.some(rb => rb && rb.id === item.id)) {
+          } else if (isBuilding && Array.isArray(removedBuildings) && !removedBuildingIds.has(item.id)) {
             setRemovedBuildings([...removedBuildings, item]);
-          } else if (isCanal && Array.isArray(removedCanals) && !removedCanals.some(rc => rc && rc.id === item.id)) {
+          } else if (isCanal && Array.isArray(removedCanals) && !removedCanalIds.has(item.id)) {
             setRemovedCanals([...removedCanals, item]);
-          } else if (isStreet && Array.isArray(removedStreets) && !removedStreets.some(rs => rs && rs.id === item.id)) {
+          } else if (isStreet && Array.isArray(removedStreets) && !removedStreetIds.has(item.id)) {
             setRemovedStreets([...removedStreets, item]);
           }
         }
@@ -599,7 +614,7 @@ export default function WeatherGameScreen({ onBackToLanding }) {
             {/* Always show canals on the map */}
             {/* Existing canals from OSM (not removed) */}
             {Array.isArray(existingCanals) && Array.isArray(removedCanals) && existingCanals
-              .filter(canal => canal && canal.id && canal.coordinates && !removedCanals.some(rc => rc && rc.id === canal.id))
+              .filter(canal => canal && canal.id && canal.coordinates && !removedCanalIds.has(canal.id))
               .map((canal) => (
                 <Polyline
                   key={canal.id}
@@ -643,7 +658,7 @@ export default function WeatherGameScreen({ onBackToLanding }) {
             {/* Always show streets on the map */}
             {/* Existing streets from OSM (not removed) */}
             {Array.isArray(existingStreets) && Array.isArray(removedStreets) && existingStreets
-              .filter(street => street && street.id && street.coordinates && !removedStreets.some(rs => rs && rs.id === street.id))
+              .filter(street => street && street.id && street.coordinates && !removedStreetIds.has(street.id))
               .map((street) => (
                 <Polyline
                   key={street.id}
@@ -689,7 +704,7 @@ export default function WeatherGameScreen({ onBackToLanding }) {
               <>
                 {/* Existing trees from OSM - Show with life token icons */}
                 {Array.isArray(existingTrees) && Array.isArray(removedTrees) && existingTrees
-                  .filter(tree => tree && tree.id && tree.coordinate && !removedTrees.some(rt => rt && rt.id === tree.id))
+                  .filter(tree => tree && tree.id && tree.coordinate && !removedTreeIds.has(tree.id))
                   .map((tree) => (
                     <Marker
                       key={tree.id}
@@ -710,7 +725,7 @@ export default function WeatherGameScreen({ onBackToLanding }) {
 
                 {/* Existing buildings from OSM - Markers */}
                 {Array.isArray(existingBuildings) && Array.isArray(removedBuildings) && existingBuildings
-                  .filter(building => building && building.id && building.coordinate && !removedBuildings.some(rb => rb && rb.id === building.id))
+                  .filter(building => building && building.id && building.coordinate && !removedBuildingIds.has(building.id))
                   .map((building) => (
                     <Marker
                       key={building.id}
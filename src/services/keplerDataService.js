@@ -3,6 +3,15 @@
  * Converts building and tree data to GeoJSON format for Kepler.gl visualization
  */
 
+// Round a coordinate to 6 decimals (~0.1 m) so the GeoJSON embedded in the WebView stays compact
+const roundCoordinate = (value) => Math.round(value * 1e6) / 1e6;
+
+// GeoJSON [lon, lat] position from a { latitude, longitude } coordinate
+const toPosition = (coord) => [roundCoordinate(coord.longitude), roundCoordinate(coord.latitude)];
+
+// Polygon ring of [lon, lat] positions with rounded coordinates
+const roundRing = (ring) => ring.map(([lon, lat]) => [roundCoordinate(lon), roundCoordinate(lat)]);
+
 /**
  * Convert buildings and trees to GeoJSON format for Kepler.gl
  * @param {Array} existingBuildings - Existing buildings from OSM
@@ -31,9 +40,15 @@ export function convertToGeoJSON(
 ) {
   const features = [];
 
+  // Index removed IDs once so filtering existing features is a constant-time lookup
+  const removedBuildingIds = new Set(removedBuildings.map(rb => rb.id));
+  const removedTreeIds = new Set(removedTrees.map(rt => rt.id));
+  const removedCanalIds = new Set(removedCanals.map(rc => rc.id));
+  const removedStreetIds = new Set(removedStreets.map(rs => rs.id));
+
   // Add existing buildings (not removed) - with polygons if available
   existingBuildings
-    .filter(building => !removedBuildings.some(rb => rb.id === building.id))
+    .filter(building => !removedBuildingIds.has(building.id))
     .forEach((building) => {
       if (building.polygon && building.polygon.length > 0) {
         // Use polygon geometry
@@ -47,7 +62,7 @@ export function convertToGeoJSON(
           },
           geometry: {
             type: 'Polygon',
-            coordinates: [building.polygon], // Polygon coordinates
+            coordinates: [roundRing(building.polygon)], // Polygon coordinates
           },
         });
       } else {
@@ -62,7 +77,7 @@ export function convertToGeoJSON(
           },
           geometry: {
             type: 'Point',
-            coordinates: [building.coordinate.longitude, building.coordinate.latitude],
+            coordinates: toPosition(building.coordinate),
           },
         });
       }
@@ -82,7 +97,7 @@ export function convertToGeoJSON(
           },
           geometry: {
             type: 'Polygon',
-            coordinates: [building.polygon],
+            coordinates: [roundRing(building.polygon)],
           },
         });
       } else {
@@ -95,7 +110,7 @@ export function convertToGeoJSON(
           },
           geometry: {
             type: 'Point',
-            coordinates: [building.coordinate.longitude, building.coordinate.latitude],
+            coordinates: toPosition(building.coordinate),
           },
         });
       }
@@ -103,7 +118,7 @@ export function convertToGeoJSON(
 
   // Add existing trees from OSM (not removed)
   existingTrees
-    .filter(tree => !removedTrees.some(rt => rt.id === tree.id))
+    .filter(tree => !removedTreeIds.has(tree.id))
     .forEach((tree) => {
       features.push({
         type: 'Feature',
@@ -114,7 +129,7 @@ export function convertToGeoJSON(
         },
         geometry: {
           type: 'Point',
-          coordinates: [tree.coordinate.longitude, tree.coordinate.latitude],
+          coordinates: toPosition(tree.coordinate),
         },
       });
     });
@@ -131,14 +146,14 @@ export function convertToGeoJSON(
         },
         geometry: {
           type: 'Point',
-          coordinates: [building.coordinate.longitude, building.coordinate.latitude],
+          coordinates: toPosition(building.coordinate),
         },
       });
     });
 
   // Add existing canals from OSM (not removed)
   existingCanals
-    .filter(canal => !removedCanals.some(rc => rc.id === canal.id))
+    .filter(canal => !removedCanalIds.has(canal.id))
     .forEach((canal) => {
       if (canal.coordinates && canal.coordinates.length > 0) {
         features.push({
@@ -151,7 +166,7 @@ export function convertToGeoJSON(
           },
           geometry: {
             type: 'LineString',
-            coordinates: canal.coordinates.map(coord => [coord.longitude, coord.latitude]),
+            coordinates: canal.coordinates.map(toPosition),
           },
         });
       }
@@ -170,7 +185,7 @@ export function convertToGeoJSON(
           },
           geometry: {
             type: 'LineString',
-            coordinates: canal.coordinates.map(coord => [coord.longitude, coord.latitude]),
+            coordinates: canal.coordinates.map(toPosition),
           },
         });
       }
@@ -178,7 +193,7 @@ export function convertToGeoJSON(
 
   // Add existing streets from OSM (not removed)
   existingStreets
-    .filter(street => !removedStreets.some(rs => rs.id === street.id))
+    .filter(street => !removedStreetIds.has(street.id))
     .forEach((street) => {
       if (street.coordinates && street.coordinates.length > 0) {
         features.push({
@@ -191,7 +206,7 @@ export function convertToGeoJSON(
           },
           geometry: {
             type: 'LineString',
-            coordinates: street.coordinates.map(coord => [coord.longitude, coord.latitude]),
+            coordinates: street.coordinates.map(toPosition),
           },
         });
       }
@@ -210,7 +225,7 @@ export function convertToGeoJSON(
           },
           geometry: {
             type: 'LineString',
-            coordinates: street.coordinates.map(coord => [coord.longitude, coord.latitude]),
+            coordinates: street.coordinates.map(toPosition),
           },
         });
       }
@@ -228,7 +243,7 @@ export function convertToGeoJSON(
         },
         geometry: {
           type: 'Polygon',
-          coordinates: [building.polygon],
+          coordinates: [roundRing(building.polygon)],
         },
       });
     } else {
@@ -241,7 +256,7 @@ export function convertToGeoJSON(
         },
         geometry: {
           type: 'Point',
-          coordinates: [building.coordinate.longitude, building.coordinate.latitude],
+          coordinates: toPosition(building.coordinate),
         },
       });
     }
@@ -708,13 +723,25 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
           // Prepare weather visualizations
           const weatherLayers = [];
           
+          // Origin and cell size of a gridSize x gridSize sampling grid centred on the view,
+          // spanning the data bounds (at least 0.01 degrees in each direction)
+          function getSamplingGrid(gridSize) {
+            const latRange = (maxLat !== -Infinity && minLat !== Infinity) ? Math.max(0.01, maxLat - minLat) : 0.01;
+            const lonRange = (maxLon !== -Infinity && minLon !== Infinity) ? Math.max(0.01, maxLon - minLon) : 0.01;
+            return {
+              latStart: viewLat - latRange / 2,
+              lonStart: viewLon - lonRange / 2,
+              latStep: latRange / gridSize,
+              lonStep: lonRange / gridSize,
+            };
+          }
+          
           // Heat map layer (temperature visualization) - always create, visibility controlled by toggle
           if (weather && weather.temperature !== undefined && weather.temperature !== null) {
             console.log('Creating heat map with temperature:', weather.temperature);
             const heatPoints = [];
             const gridSize = 30; // Increased grid size for better coverage
-            const latRange = (maxLat !== -Infinity && minLat !== Infinity) ? Math.max(0.01, maxLat - minLat) : 0.01;
-            const lonRange = (maxLon !== -Infinity && minLon !== Infinity) ? Math.max(0.01, maxLon - minLon) : 0.01;
+            const { latStart, lonStart, latStep, lonStep } = getSamplingGrid(gridSize);
             
             // Temperature color mapping (blue = cold, red = hot)
             const temp = weather.temperature || 10;
@@ -723,9 +750,10 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
             const normalizedTemp = Math.max(0, Math.min(1, (temp - minTemp) / (maxTemp - minTemp)));
             
             for (let i = 0; i < gridSize; i++) {
+              // Latitude only depends on the row, so compute it once per row
+              const lat = latStart + i * latStep;
               for (let j = 0; j < gridSize; j++) {
-                const lat = viewLat + (i / gridSize - 0.5) * latRange;
-                const lon = viewLon + (j / gridSize - 0.5) * lonRange;
+                const lon = lonStart + j * lonStep;
                 heatPoints.push({
                   position: [lon, lat],
                   temperature: temp,
@@ -764,14 +792,16 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
             console.log('Creating wind visualization with speed:', weather.windSpeed, 'direction:', weather.windDirection);
             const windArrows = [];
             const gridSize = 20; // Increased grid size
-            const latRange = (maxLat !== -Infinity && minLat !== Infinity) ? Math.max(0.01, maxLat - minLat) : 0.01;
-            const lonRange = (maxLon !== -Infinity && minLon !== Infinity) ? Math.max(0.01, maxLon - minLon) : 0.01;
+            const { latStart, lonStart, latStep, lonStep } = getSamplingGrid(gridSize);
             
             const windSpeed = weather.windSpeed || 10;
             const windDir = (weather.windDirection || 0) * Math.PI / 180; // Convert to radians
             // Make arrows more visible - scale by wind speed in meters
             const arrowLengthMeters = Math.min(100, Math.max(20, windSpeed * 3));
             const arrowLength = arrowLengthMeters / 111000; // Convert meters to degrees
+            // Arrow offset is the same for every cell, so compute it once
+            const arrowDLat = arrowLength * Math.cos(windDir);
+            const arrowDLon = arrowLength * Math.sin(windDir);
             
             // Wind speed color: light blue (calm) -> dark blue (strong)
             const windIntensity = Math.min(1, windSpeed / 30);
@@ -783,13 +813,15 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
             ];
             
             for (let i = 0; i < gridSize; i++) {
+              const lat = latStart + i * latStep;
+              // Longitude degrees shrink with latitude; the correction is constant along a row
+              const rowArrowDLon = arrowDLon / Math.cos(lat * Math.PI / 180);
               for (let j = 0; j < gridSize; j++) {
-                const lat = viewLat + (i / gridSize - 0.5) * latRange;
-                const lon = viewLon + (j / gridSize - 0.5) * lonRange;
+                const lon = lonStart + j * lonStep;
                 
                 // Create arrow path (line from center pointing in wind direction)
-                const endLat = lat + arrowLength * Math.cos(windDir);
-                const endLon = lon + arrowLength * Math.sin(windDir) / Math.cos(lat * Math.PI / 180);
+                const endLat = lat + arrowDLat;
+                const endLon = lon + rowArrowDLon;
                 
                 windArrows.push({
                   path: [[lon, lat], [endLon, endLat]],
@@ -828,8 +860,7 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
           if (weather && weather.temperature !== undefined && weather.temperature !== null && showTemperatureLayer) {
             const tempPoints = [];
             const gridSize = 25;
-            const latRange = (maxLat !== -Infinity && minLat !== Infinity) ? Math.max(0.01, maxLat - minLat) : 0.01;
-            const lonRange = (maxLon !== -Infinity && minLon !== Infinity) ? Math.max(0.01, maxLon - minLon) : 0.01;
+            const { latStart, lonStart, latStep, lonStep } = getSamplingGrid(gridSize);
             
             const temp = weather.temperature || 10;
             const minTemp = -10;
@@ -842,9 +873,9 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
             const b = normalizedTemp < 0.5 ? Math.floor(255 - normalizedTemp * 510) : Math.floor(255 - (normalizedTemp - 0.5) * 510);
             
             for (let i = 0; i < gridSize; i++) {
+              const lat = latStart + i * latStep;
               for (let j = 0; j < gridSize; j++) {
-                const lat = viewLat + (i / gridSize - 0.5) * latRange;
-                const lon = viewLon + (j / gridSize - 0.5) * lonRange;
+                const lon = lonStart + j * lonStep;
                 tempPoints.push({
                   position: [lon, lat],
                   temperature: temp,
@@ -878,8 +909,7 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
           if (weather && weather.humidity !== undefined && weather.humidity !== null && showHumidityLayer) {
             const humidityPoints = [];
             const gridSize = 25;
-            const latRange = (maxLat !== -Infinity && minLat !== Infinity) ? Math.max(0.01, maxLat - minLat) : 0.01;
-            const lonRange = (maxLon !== -Infinity && minLon !== Infinity) ? Math.max(0.01, maxLon - minLon) : 0.01;
+            const { latStart, lonStart, latStep, lonStep } = getSamplingGrid(gridSize);
             
             const humidity = weather.humidity || 50;
             const normalizedHumidity = Math.max(0, Math.min(1, humidity / 100));
@@ -890,9 +920,9 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
             const r = Math.floor(200 - normalizedHumidity * 100);
             
             for (let i = 0; i < gridSize; i++) {
+              const lat = latStart + i * latStep;
               for (let j = 0; j < gridSize; j++) {
-                const lat = viewLat + (i / gridSize - 0.5) * latRange;
-                const lon = viewLon + (j / gridSize - 0.5) * lonRange;
+                const lon = lonStart + j * lonStep;
                 humidityPoints.push({
                   position: [lon, lat],
                   humidity: humidity,
@@ -927,8 +957,7 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
           if (weather && weather.co2 !== undefined && weather.co2 !== null && showCO2Layer) {
             const co2Points = [];
             const gridSize = 25;
-            const latRange = (maxLat !== -Infinity && minLat !== Infinity) ? Math.max(0.01, maxLat - minLat) : 0.01;
-            const lonRange = (maxLon !== -Infinity && minLon !== Infinity) ? Math.max(0.01, maxLon - minLon) : 0.01;
+            const { latStart, lonStart, latStep, lonStep } = getSamplingGrid(gridSize);
             
             const co2 = weather.co2 || 400;
             const minCO2 = 300;
@@ -936,9 +965,9 @@ export function generateDeckGLHTML(geoJsonData, location, weatherData = null, ma
             const normalizedCO2 = Math.max(0, Math.min(1, (co2 - minCO2) / (maxCO2 - minCO2)));
             
             for (let i = 0; i < gridSize; i++) {
+              const lat = latStart + i * latStep;
               for (let j = 0; j < gridSize; j++) {
-                const lat = viewLat + (i / gridSize - 0.5) * latRange;
-                const lon = viewLon + (j / gridSize - 0.5) * lonRange;
+                const lon = lonStart + j * lonStep;
                 co2Points.push({
                   position: [lon, lat],
                   co2: co2,
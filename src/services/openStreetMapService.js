@@ -5,6 +5,64 @@
 
 const OVERPASS_API = 'https://overpass-api.de/api/interpreter';
 
+// Recent successful Overpass responses, keyed by feature type and rounded center
+const OVERPASS_CACHE_TTL_MS = 10 * 60 * 1000;
+const OVERPASS_CACHE_MAX_ENTRIES = 16;
+const overpassCache = new Map();
+
+/**
+ * Build the cache key for an Overpass request
+ * The center is rounded to 3 decimals (~100 m) so nearby GPS fixes share an entry
+ * @param {string} featureType - Kind of features requested (e.g. 'trees')
+ * @param {number} latitude - Center latitude
+ * @param {number} longitude - Center longitude
+ * @param {number} radius - Radius in degrees
+ * @returns {string} Cache key
+ */
+function overpassCacheKey(featureType, latitude, longitude, radius) {
+  return `${featureType}:${latitude.toFixed(3)},${longitude.toFixed(3)},${radius}`;
+}
+
+/**
+ * Run an Overpass query, reusing a recent response for the same area
+ * @param {string} query - Overpass QL query
+ * @param {string} cacheKey - Key from overpassCacheKey
+ * @returns {Promise<Object|null>} Parsed response, or null if the request failed
+ */
+async function fetchOverpass(query, cacheKey) {
+  const cached = overpassCache.get(cacheKey);
+  if (cached && Date.now() - cached.timestamp < OVERPASS_CACHE_TTL_MS) {
+    return cached.data;
+  }
+  overpassCache.delete(cacheKey);
+
+  const response = await fetch(OVERPASS_API, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/x-www-form-urlencoded',
+    },
+    body: `data=${encodeURIComponent(query)}`,
+  });
+
+  if (!response.ok) {
+    return null;
+  }
+
+  const data = await response.json();
+
+  // Overpass reports timeouts and rate limits as HTTP 200 with a remark, so only
+  // keep complete, non-empty results and let the next visit retry otherwise
+  if (data && !data.remark && Array.isArray(data.elements) && data.elements.length > 0) {
+    if (overpassCache.size >= OVERPASS_CACHE_MAX_ENTRIES) {
+      // Map iterates in insertion order, so the first key is the oldest entry
+      overpassCache.delete(overpassCache.keys().next().value);
+    }
+    overpassCache.set(cacheKey, { data, timestamp: Date.now() });
+  }
+
+  return data;
+}
+
 /**
  * Fetch buildings from OpenStreetMap in a bounding box
  * @param {number} latitude - Center latitude
@@ -164,16 +222,9 @@ export async function fetchBuildingsSimple(latitude, longitude, radius = 0.01) {
 out geom;`;
 
   try {
-    const response = await fetch(OVERPASS_API, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/x-www-form-urlencoded',
-      },
-      body: `data=${encodeURIComponent(query)}`,
-    });
+    const data = await fetchOverpass(query, overpassCacheKey('buildings', latitude, longitude, radius));
 
-    if (response.ok) {
-      const data = await response.json();
+    if (data) {
       return parseOSMBuildingsWithGeometry(data, latitude, longitude);
     } else {
       return generateMockBuildingsWithGeometry(latitude, longitude, radius);
@@ -342,16 +393,9 @@ export async function fetchTreesFromOSM(latitude, longitude, radius = 0.01) {
 out geom;`;
 
   try {
-    const response = await fetch(OVERPASS_API, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/x-www-form-urlencoded',
-      },
-      body: `data=${encodeURIComponent(query)}`,
-    });
+    const data = await fetchOverpass(query, overpassCacheKey('trees', latitude, longitude, radius));
 
-    if (response.ok) {
-      const data = await response.json();
+    if (data) {
       return parseOSMTrees(data, latitude, longitude);
     } else {
       return generateMockTrees(latitude, longitude, radius);
@@ -483,16 +527,9 @@ export async function fetchCanalsFromOSM(latitude, longitude, radius = 0.01) {
 out geom;`;
 
   try {
-    const response = await fetch(OVERPASS_API, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/x-www-form-urlencoded',
-      },
-      body: `data=${encodeURIComponent(query)}`,
-    });
+    const data = await fetchOverpass(query, overpassCacheKey('canals', latitude, longitude, radius));
 
-    if (response.ok) {
-      const data = await response.json();
+    if (data) {
       return parseOSMCanals(data, latitude, longitude);
     } else {
       return generateMockCanals(latitude, longitude, radius);
@@ -605,16 +642,9 @@ export async function fetchStreetsFromOSM(latitude, longitude, radius = 0.01) {
 out geom;`;
 
   try {
-    const response = await fetch(OVERPASS_API, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/x-www-form-urlencoded',
-      },
-      body: `data=${encodeURIComponent(query)}`,
-    });
+    const data = await fetchOverpass(query, overpassCacheKey('streets', latitude, longitude, radius));
 
-    if (response.ok) {
-      const data = await response.json();
+    if (data) {
       return parseOSMStreets(data, latitude, longitude);
     } else {
       return generateMockStreets(latitude, longitude, radius);